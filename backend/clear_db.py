@@ -9,11 +9,12 @@ DATABASE_PATH = Path(__file__).parent / "big_board.db"
 async def clear_database():
     """Clear all data from the database and re-initialize with defaults."""
     import aiosqlite
-    from database import init_db
+    from database import init_db, close_db
 
     if not DATABASE_PATH.exists():
         print("Database does not exist. Creating fresh database...")
         await init_db()
+        await close_db()
         print("Done.")
         return
 
@@ -25,6 +26,7 @@ async def clear_database():
 
     # Re-initialize with default categories
     await init_db()
+    await close_db()
     print("Database cleared and re-initialized with defaults.")
 
 if __name__ == "__main__":
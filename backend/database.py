@@ -1,12 +1,18 @@
+import asyncio
 import aiosqlite
 import json
-from datetime import datetime, date
+import logging
+import re
+from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from pydantic import BaseModel
 
 DATABASE_PATH = Path(__file__).parent / "big_board.db"
 
+# Goes to stderr: in the stdio MCP server, stdout carries the protocol
+logger = logging.getLogger(__name__)
+
 # Default bright colors for family members
 DEFAULT_COLORS = [
     "#FF6B6B",  # coral red
@@ -40,7 +46,7 @@ class Item(BaseModel):
 class FamilyMember(BaseModel):
     id: Optional[int] = None
     name: str
-    color: str
+    color: str  # #RRGGBB; stored as a 24-bit integer
 
 
 class Category(BaseModel):
@@ -48,286 +54,532 @@ class Category(BaseModel):
     name: str
 
 
+_db: Optional[aiosqlite.Connection] = None
+# Reads use their own connection: on the write connection they would see
+# another coroutine's uncommitted (and possibly rolled back) statements.
+_read_db: Optional[aiosqlite.Connection] = None
+_db_lock = asyncio.Lock()
+# Serializes write sequences so one helper's commit can't land in the
+# middle of another's statements on the shared connection.
+_write_lock = asyncio.Lock()
+# Bumped on every item write so callers can tell when cached item reads are stale
+_items_version = 0
+
+
+async def _connect() -> aiosqlite.Connection:
+    # sqlite3 keeps compiled statements per connection, keyed by SQL
+    # text; with one long-lived connection the hot queries are only
+    # prepared once. Leave headroom for update_item's dynamic SQL.
+    conn = await aiosqlite.connect(DATABASE_PATH, cached_statements=256)
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA busy_timeout=30000")
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    await conn.execute("PRAGMA cache_size=-20000")
+    await conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+async def get_db() -> aiosqlite.Connection:
+    """Get the shared write connection, opening it on first use."""
+    global _db
+    if _db is None:
+        async with _db_lock:
+            if _db is None:
+                _db = await _connect()
+    return _db
+
+
+async def get_read_db() -> aiosqlite.Connection:
+    """Get the shared read-only connection, opening it on first use.
+
+    It only sees committed data; with WAL its reads also don't wait for
+    an in-progress write.
+    """
+    global _read_db
+    if _read_db is None:
+        async with _db_lock:
+            if _read_db is None:
+                conn = await _connect()
+                await conn.execute("PRAGMA query_only=ON")
+                _read_db = conn
+    return _read_db
+
+
+async def close_db():
+    """Close the shared connections."""
+    global _db, _read_db
+    if _read_db is not None:
+        await _read_db.close()
+        _read_db = None
+    if _db is not None:
+        await _db.close()
+        _db = None
+
+
 async def init_db():
     """Initialize the database with required tables."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                family_member TEXT NOT NULL,
-                date TEXT NOT NULL,
-                time TEXT,
-                category TEXT NOT NULL,
-                recurrence TEXT,
-                recurrence_day INTEGER,
-                handled INTEGER DEFAULT 0,
-                handled_date TEXT,
-                stay_until_done INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    db = await get_db()
+    async with _write_lock:
+        # WAL lets broadcasts read while a write is in progress; it persists
+        # in the database file so every later connection picks it up.
+        cursor = await db.execute("PRAGMA journal_mode=WAL")
+        journal_mode = (await cursor.fetchone())[0]
+        if journal_mode.lower() != "wal":
+            logger.warning("could not enable WAL journal mode (got %s)", journal_mode)
+
+        # Run the schema setup as one transaction (one commit) rather than
+        # letting each DDL statement autocommit
+        await db.execute("BEGIN")
+        try:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    family_member TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    time TEXT,
+                    category TEXT NOT NULL,
+                    recurrence TEXT,
+                    recurrence_day INTEGER,
+                    handled INTEGER DEFAULT 0,
+                    handled_date TEXT,
+                    stay_until_done INTEGER DEFAULT 0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # Migration: add stay_until_done column if it doesn't exist
+            try:
+                await db.execute("ALTER TABLE items ADD COLUMN stay_until_done INTEGER DEFAULT 0")
+            except Exception:
+                pass  # Column already exists
+
+            # Normalize legacy NULLs so queries can test stay_until_done = 0 directly
+            await db.execute("UPDATE items SET stay_until_done = 0 WHERE stay_until_done IS NULL")
+
+            # (date, handled) also serves plain date lookups, so it replaces
+            # the earlier single-column idx_items_date
+            await db.execute("DROP INDEX IF EXISTS idx_items_date")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_items_date_handled ON items(date, handled)")
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_recurrence ON items(recurrence) WHERE recurrence IS NOT NULL"
+            )
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_stay ON items(stay_until_done, handled) WHERE stay_until_done = 1"
+            )
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_time_title ON items(COALESCE(time, '99:99'), title)"
             )
-        """)
 
-        # Migration: add stay_until_done column if it doesn't exist
-        try:
-            await db.execute("ALTER TABLE items ADD COLUMN stay_until_done INTEGER DEFAULT 0")
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS family_members (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    color INTEGER NOT NULL
+                )
+            """)
+
+            # Migration: colors used to be stored as '#RRGGBB' text. A TEXT column
+            # would coerce integers back to text, so rebuild the table.
+            cursor = await db.execute(
+                "SELECT type FROM pragma_table_info('family_members') WHERE name = 'color'"
+            )
+            if (await cursor.fetchone())[0].upper() == "TEXT":
+                cursor = await db.execute("SELECT id, name, color FROM family_members")
+                members = await cursor.fetchall()
+                await db.execute("ALTER TABLE family_members RENAME TO family_members_old")
+                await db.execute("""
+                    CREATE TABLE family_members (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name TEXT UNIQUE NOT NULL,
+                        color INTEGER NOT NULL
+                    )
+                """)
+                await db.executemany(
+                    "INSERT INTO family_members (id, name, color) VALUES (?, ?, ?)",
+                    [(m["id"], m["name"], _legacy_color_to_int(m["id"], m["name"], m["color"])) for m in members]
+                )
+                await db.execute("DROP TABLE family_members_old")
+
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS categories (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL
+                )
+            """)
+
+            # Insert default categories if empty
+            cursor = await db.execute("SELECT 1 FROM categories LIMIT 1")
+            if await cursor.fetchone() is None:
+                await db.executemany(
+                    "INSERT INTO categories (name) VALUES (?)",
+                    [(cat,) for cat in DEFAULT_CATEGORIES]
+                )
+
+            await db.commit()
         except Exception:
-            pass  # Column already exists
+            await db.rollback()
+            raise
 
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS family_members (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                color TEXT NOT NULL
-            )
-        """)
 
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL
-            )
-        """)
+def _color_to_int(color: str) -> int:
+    """Convert a '#RRGGBB' color to its 24-bit integer value."""
+    return int(color.lstrip("#"), 16)
 
-        # Insert default categories if empty
-        cursor = await db.execute("SELECT COUNT(*) FROM categories")
-        count = (await cursor.fetchone())[0]
-        if count == 0:
-            for cat in DEFAULT_CATEGORIES:
-                await db.execute("INSERT INTO categories (name) VALUES (?)", (cat,))
 
-        await db.commit()
+def _color_to_hex(value: int) -> str:
+    """Convert a 24-bit integer color back to '#RRGGBB'."""
+    return f"#{value:06X}"
 
 
-async def get_or_create_family_member(name: str) -> FamilyMember:
-    """Get a family member by name, creating with a color if they don't exist."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
-            "SELECT * FROM family_members WHERE name = ?", (name,)
-        )
-        row = await cursor.fetchone()
+_HEX_COLOR_RE = re.compile(r"#?([0-9A-Fa-f]{6})")
+_SHORT_HEX_COLOR_RE = re.compile(r"#?([0-9A-Fa-f]{3})")
 
-        if row:
-            return FamilyMember(id=row["id"], name=row["name"], color=row["color"])
 
-        # Assign next available color
-        cursor = await db.execute("SELECT COUNT(*) FROM family_members")
-        count = (await cursor.fetchone())[0]
-        color = DEFAULT_COLORS[count % len(DEFAULT_COLORS)]
+def _legacy_color_to_int(member_id: int, name: str, color: str) -> int:
+    """Convert a color stored as text by older versions to its integer value."""
+    color = color.strip()
+    match = _HEX_COLOR_RE.fullmatch(color)
+    if match:
+        return int(match.group(1), 16)
+    match = _SHORT_HEX_COLOR_RE.fullmatch(color)
+    if match:
+        # '#RGB' is shorthand for '#RRGGBB'
+        return int("".join(c * 2 for c in match.group(1)), 16)
+
+    # Not a hex color (e.g. a CSS name); fall back to the default palette
+    fallback = DEFAULT_COLORS[(member_id - 1) % len(DEFAULT_COLORS)]
+    logger.warning(
+        "family member %r: color %r is not a hex color, replaced with %s", name, color, fallback
+    )
+    return _color_to_int(fallback)
+
+
+def _row_to_family_member(row) -> FamilyMember:
+    return FamilyMember(id=row["id"], name=row["name"], color=_color_to_hex(row["color"]))
 
-        cursor = await db.execute(
-            "INSERT INTO family_members (name, color) VALUES (?, ?)",
-            (name, color)
-        )
-        await db.commit()
 
-        return FamilyMember(id=cursor.lastrowid, name=name, color=color)
+# Insert a family member with the next palette color in one statement.
+# The palette index is the current member count, so it restarts when the
+# table is cleared (AUTOINCREMENT ids would keep counting past a clear).
+_INSERT_FAMILY_MEMBER_SQL = f"""
+    INSERT INTO family_members (name, color)
+    SELECT ?, CASE COUNT(*) % {len(DEFAULT_COLORS)}
+        {" ".join(f"WHEN {i} THEN {_color_to_int(c)}" for i, c in enumerate(DEFAULT_COLORS))}
+    END
+    FROM family_members
+    RETURNING id, name, color
+"""
+
+
+def items_version() -> int:
+    """Counter that changes whenever this process writes to the items table."""
+    return _items_version
+
+
+def _bump_items_version():
+    global _items_version
+    _items_version += 1
+
+
+async def _get_or_create_family_member(db: aiosqlite.Connection, name: str) -> FamilyMember:
+    """Look up or insert a family member without committing; caller holds _write_lock."""
+    cursor = await db.execute(
+        "SELECT * FROM family_members WHERE name = ?", (name,)
+    )
+    row = await cursor.fetchone()
+
+    if row:
+        return _row_to_family_member(row)
+
+    cursor = await db.execute(_INSERT_FAMILY_MEMBER_SQL, (name,))
+    return _row_to_family_member(await cursor.fetchone())
+
+
+async def get_or_create_family_member(name: str) -> FamilyMember:
+    """Get a family member by name, creating with a color if they don't exist."""
+    db = await get_db()
+    async with _write_lock:
+        try:
+            member = await _get_or_create_family_member(db, name)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+    return member
 
 
 async def get_family_members() -> list[FamilyMember]:
     """Get all family members."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM family_members ORDER BY name")
-        rows = await cursor.fetchall()
-        return [FamilyMember(id=r["id"], name=r["name"], color=r["color"]) for r in rows]
+    db = await get_read_db()
+    cursor = await db.execute("SELECT * FROM family_members ORDER BY name")
+    rows = await cursor.fetchall()
+    return [_row_to_family_member(r) for r in rows]
 
 
 async def update_family_member_color(name: str, color: str) -> FamilyMember:
     """Update a family member's color."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        await db.execute(
-            "UPDATE family_members SET color = ? WHERE name = ?",
-            (color, name)
-        )
-        await db.commit()
-        return await get_or_create_family_member(name)
+    db = await get_db()
+    async with _write_lock:
+        try:
+            cursor = await db.execute(
+                "UPDATE family_members SET color = ? WHERE name = ? RETURNING id, name, color",
+                (_color_to_int(color), name)
+            )
+            row = await cursor.fetchone()
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    if row:
+        return _row_to_family_member(row)
+    return await get_or_create_family_member(name)
 
 
 async def get_categories() -> list[Category]:
     """Get all categories."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM categories ORDER BY name")
-        rows = await cursor.fetchall()
-        return [Category(id=r["id"], name=r["name"]) for r in rows]
+    db = await get_read_db()
+    cursor = await db.execute("SELECT * FROM categories ORDER BY name")
+    rows = await cursor.fetchall()
+    return [Category(id=r["id"], name=r["name"]) for r in rows]
 
 
 async def add_category(name: str) -> Category:
     """Add a new category."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        cursor = await db.execute(
-            "INSERT OR IGNORE INTO categories (name) VALUES (?)", (name,)
-        )
-        await db.commit()
+    db = await get_db()
+    async with _write_lock:
+        try:
+            cursor = await db.execute(
+                "INSERT OR IGNORE INTO categories (name) VALUES (?) RETURNING id, name", (name,)
+            )
+            row = await cursor.fetchone()
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
 
-        cursor = await db.execute("SELECT * FROM categories WHERE name = ?", (name,))
+    if row is None:
+        # Already existed, so nothing was inserted or returned
+        read_db = await get_read_db()
+        cursor = await read_db.execute("SELECT id, name FROM categories WHERE name = ?", (name,))
         row = await cursor.fetchone()
-        return Category(id=row[0], name=row[1])
+    return Category(id=row["id"], name=row["name"])
 
 
 async def delete_category(name: str) -> bool:
     """Delete a category."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        cursor = await db.execute("DELETE FROM categories WHERE name = ?", (name,))
-        await db.commit()
-        return cursor.rowcount > 0
+    db = await get_db()
+    async with _write_lock:
+        try:
+            cursor = await db.execute("DELETE FROM categories WHERE name = ?", (name,))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+    return cursor.rowcount > 0
+
+
+def _row_to_dict(row) -> dict:
+    """Convert a row to a plain dict shaped like Item.model_dump()."""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "family_member": row["family_member"],
+        "date": row["date"],
+        "time": row["time"],
+        "category": row["category"],
+        "recurrence": row["recurrence"],
+        "recurrence_day": row["recurrence_day"],
+        "handled": bool(row["handled"]),
+        "handled_date": row["handled_date"],
+        "stay_until_done": bool(row["stay_until_done"]),
+        "created_at": row["created_at"],
+    }
 
 
 def _row_to_item(row) -> Item:
-    return Item(
-        id=row["id"],
-        title=row["title"],
-        family_member=row["family_member"],
-        date=row["date"],
-        time=row["time"],
-        category=row["category"],
-        recurrence=row["recurrence"],
-        recurrence_day=row["recurrence_day"],
-        handled=bool(row["handled"]),
-        handled_date=row["handled_date"],
-        stay_until_done=bool(row["stay_until_done"]) if row["stay_until_done"] is not None else False,
-        created_at=row["created_at"],
-    )
-
+    return Item(**_row_to_dict(row))
 
-def _matches_recurrence(item_date: str, item_recurrence: str, item_recurrence_day: Optional[int], target_date: date) -> bool:
-    """Check if a recurring item matches the target date."""
-    if not item_recurrence:
-        return False
 
-    item_date_obj = datetime.strptime(item_date, "%Y-%m-%d").date()
+async def _insert_item(db: aiosqlite.Connection, item: Item) -> Item:
+    """Insert an item and its family member without committing; caller holds _write_lock."""
+    await _get_or_create_family_member(db, item.family_member)
+    cursor = await db.execute(
+        """INSERT INTO items (title, family_member, date, time, category, recurrence, recurrence_day, stay_until_done)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (item.title, item.family_member, item.date, item.time, item.category,
+         item.recurrence, item.recurrence_day, 1 if item.stay_until_done else 0)
+    )
+    item.id = cursor.lastrowid
+    return item
 
-    # Don't show before the original date
-    if target_date < item_date_obj:
-        return False
 
-    if item_recurrence == "daily":
-        return True
-    elif item_recurrence == "weekdays":
-        return target_date.weekday() < 5  # Mon-Fri
-    elif item_recurrence == "weekly":
-        if item_recurrence_day is not None:
-            return target_date.weekday() == item_recurrence_day
-        return target_date.weekday() == item_date_obj.weekday()
-    elif item_recurrence == "monthly":
-        if item_recurrence_day is not None:
-            return target_date.day == item_recurrence_day
-        return target_date.day == item_date_obj.day
+async def add_item(item: Item) -> Item:
+    """Add a new item."""
+    db = await get_db()
+    async with _write_lock:
+        try:
+            await _insert_item(db, item)
+            await db.commit()
+            _bump_items_version()
+        except Exception:
+            await db.rollback()
+            raise
+    return item
 
-    return False
 
+async def add_items(items: list[Item]) -> list[Item]:
+    """Add several items in a single transaction."""
+    db = await get_db()
+    async with _write_lock:
+        try:
+            for item in items:
+                await _insert_item(db, item)
+            await db.commit()
+            _bump_items_version()
+        except Exception:
+            await db.rollback()
+            raise
+    return items
+
+
+# Items shown on :d - exact date matches, recurring items that fall on the
+# target date and unhandled stay_until_done items (regardless of date).
+# recurrence_day uses Python's weekday() numbering (0=Monday) while
+# strftime('%w') starts at Sunday, hence the +6 % 7.
+# handled only counts if it was handled on the target date, so it
+# resets at midnight.
+_ITEMS_FOR_DATE_SQL = """
+    SELECT id, title, family_member, date, time, category, recurrence, recurrence_day,
+           CASE WHEN handled AND handled_date = :d THEN 1 ELSE 0 END AS handled,
+           handled_date, stay_until_done, created_at
+    FROM items
+    WHERE ((items.stay_until_done = 0
+            AND (items.date = :d
+                 OR (items.date <= :d AND (
+                     items.recurrence = 'daily'
+                     OR (items.recurrence = 'weekdays' AND :weekday < 5)
+                     OR (items.recurrence = 'weekly' AND :weekday = COALESCE(
+                         items.recurrence_day,
+                         (CAST(strftime('%w', items.date) AS INTEGER) + 6) % 7))
+                     OR (items.recurrence = 'monthly' AND :day = COALESCE(
+                         items.recurrence_day,
+                         CAST(strftime('%d', items.date) AS INTEGER)))))))
+           OR (items.stay_until_done = 1 AND items.handled = 0))
+"""
+
+
+def _date_params(target_date: date) -> dict:
+    return {
+        "d": target_date.strftime("%Y-%m-%d"),
+        "weekday": target_date.weekday(),
+        "day": target_date.day,
+    }
+
+
+async def get_items_for_date_raw(target_date: date) -> list[dict]:
+    """Get items for a specific date as plain dicts, skipping model construction.
+
+    Used on the broadcast path where the result goes straight to JSON.
+    """
+    db = await get_read_db()
+    cursor = await db.execute(
+        _ITEMS_FOR_DATE_SQL + "ORDER BY COALESCE(items.time, '99:99'), items.title",
+        _date_params(target_date)
+    )
+    rows = await cursor.fetchall()
+    return [_row_to_dict(row) for row in rows]
 
-async def add_item(item: Item) -> Item:
-    """Add a new item."""
-    # Ensure family member exists
-    await get_or_create_family_member(item.family_member)
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        cursor = await db.execute(
-            """INSERT INTO items (title, family_member, date, time, category, recurrence, recurrence_day, stay_until_done)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (item.title, item.family_member, item.date, item.time, item.category,
-             item.recurrence, item.recurrence_day, 1 if item.stay_until_done else 0)
-        )
-        await db.commit()
-        item.id = cursor.lastrowid
-        return item
+async def get_item_for_date_raw(item_id: int, target_date: date) -> Optional[dict]:
+    """Get one item as a plain dict if it is shown on the given date, else None."""
+    db = await get_read_db()
+    cursor = await db.execute(
+        _ITEMS_FOR_DATE_SQL + "AND items.id = :id",
+        {**_date_params(target_date), "id": item_id}
+    )
+    row = await cursor.fetchone()
+    return _row_to_dict(row) if row else None
 
 
 async def get_items_for_date(target_date: date) -> list[Item]:
     """Get all items for a specific date, including recurring items and stay_until_done items."""
-    target_str = target_date.strftime("%Y-%m-%d")
+    return [Item(**item) for item in await get_items_for_date_raw(target_date)]
 
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
 
-        # Get exact date matches (excluding stay_until_done which we handle separately)
-        cursor = await db.execute(
-            "SELECT * FROM items WHERE date = ? AND (stay_until_done = 0 OR stay_until_done IS NULL) ORDER BY time, title",
-            (target_str,)
-        )
-        exact_rows = await cursor.fetchall()
+async def get_all_items() -> list[Item]:
+    """Get all items."""
+    db = await get_read_db()
+    cursor = await db.execute("SELECT * FROM items ORDER BY date, time, title")
+    rows = await cursor.fetchall()
+    return [_row_to_item(r) for r in rows]
 
-        # Get recurring items (excluding stay_until_done)
+
+async def get_items_in_range(date_from: Optional[date], date_to: date) -> list[Item]:
+    """Get items whose own date falls in [date_from, date_to]; recurrences are not expanded."""
+    db = await get_read_db()
+    if date_from is None:
         cursor = await db.execute(
-            "SELECT * FROM items WHERE recurrence IS NOT NULL AND (stay_until_done = 0 OR stay_until_done IS NULL)"
+            "SELECT * FROM items WHERE date <= ? ORDER BY date, time, title",
+            (date_to.isoformat(),)
         )
-        recurring_rows = await cursor.fetchall()
-
-        # Get all unhandled stay_until_done items (regardless of date)
+    else:
         cursor = await db.execute(
-            "SELECT * FROM items WHERE stay_until_done = 1 AND handled = 0"
+            "SELECT * FROM items WHERE date BETWEEN ? AND ? ORDER BY date, time, title",
+            (date_from.isoformat(), date_to.isoformat())
         )
-        stay_until_done_rows = await cursor.fetchall()
-
-        items = []
-
-        for row in exact_rows:
-            item = _row_to_item(row)
-            # Reset handled if it was handled on a different day than the target date
-            if item.handled and item.handled_date != target_str:
-                item.handled = False
-            items.append(item)
-
-        for row in recurring_rows:
-            if row["date"] == target_str:
-                continue  # Already included above
+    rows = await cursor.fetchall()
+    return [_row_to_item(r) for r in rows]
 
-            if _matches_recurrence(row["date"], row["recurrence"], row["recurrence_day"], target_date):
-                item = _row_to_item(row)
-                # For recurring items, check if handled on the target date
-                if item.handled and item.handled_date != target_str:
-                    item.handled = False
-                items.append(item)
 
-        # Add stay_until_done items (they persist until handled)
-        for row in stay_until_done_rows:
-            item = _row_to_item(row)
-            items.append(item)
+async def iter_all_items() -> AsyncIterator[Item]:
+    """Yield all items in get_all_items() order without loading them all at once."""
+    db = await get_read_db()
+    async with db.execute("SELECT * FROM items ORDER BY date, time, title") as cursor:
+        async for row in cursor:
+            yield _row_to_item(row)
 
-        # Sort by time, then title
-        items.sort(key=lambda x: (x.time or "99:99", x.title))
-        return items
 
-
-async def get_all_items() -> list[Item]:
-    """Get all items."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute("SELECT * FROM items ORDER BY date, time, title")
-        rows = await cursor.fetchall()
-        return [_row_to_item(r) for r in rows]
+async def get_item_by_id(item_id: int) -> Optional[Item]:
+    """Get a single item by ID."""
+    db = await get_read_db()
+    cursor = await db.execute("SELECT * FROM items WHERE id = ?", (item_id,))
+    row = await cursor.fetchone()
+    return _row_to_item(row) if row else None
 
 
 async def update_item(item_id: int, updates: dict) -> Optional[Item]:
     """Update an existing item."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
-        # Build update query
-        set_clauses = []
-        values = []
-        for key, value in updates.items():
-            if key in ["title", "family_member", "date", "time", "category",
-                       "recurrence", "recurrence_day", "handled", "handled_date", "stay_until_done"]:
-                set_clauses.append(f"{key} = ?")
-                values.append(value)
-
-        if not set_clauses:
-            return None
-
-        values.append(item_id)
-        await db.execute(
-            f"UPDATE items SET {', '.join(set_clauses)} WHERE id = ?",
-            values
-        )
-        await db.commit()
+    db = await get_db()
+
+    # Build update query
+    set_clauses = []
+    values = []
+    for key, value in updates.items():
+        if key in ["title", "family_member", "date", "time", "category",
+                   "recurrence", "recurrence_day", "handled", "handled_date", "stay_until_done"]:
+            set_clauses.append(f"{key} = ?")
+            values.append(value)
+
+    if not set_clauses:
+        return None
+
+    values.append(item_id)
+    async with _write_lock:
+        try:
+            await db.execute(
+                f"UPDATE items SET {', '.join(set_clauses)} WHERE id = ?",
+                values
+            )
+            await db.commit()
+            _bump_items_version()
+        except Exception:
+            await db.rollback()
+            raise
 
-        cursor = await db.execute("SELECT * FROM items WHERE id = ?", (item_id,))
-        row = await cursor.fetchone()
-        return _row_to_item(row) if row else None
+    return await get_item_by_id(item_id)
 
 
 async def mark_item_handled(item_id: int, handled: bool = True) -> Optional[Item]:
@@ -341,7 +593,13 @@ async def mark_item_handled(item_id: int, handled: bool = True) -> Optional[Item
 
 async def delete_item(item_id: int) -> bool:
     """Delete an item."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        cursor = await db.execute("DELETE FROM items WHERE id = ?", (item_id,))
-        await db.commit()
-        return cursor.rowcount > 0
+    db = await get_db()
+    async with _write_lock:
+        try:
+            cursor = await db.execute("DELETE FROM items WHERE id = ?", (item_id,))
+            await db.commit()
+            _bump_items_version()
+        except Exception:
+            await db.rollback()
+            raise
+    return cursor.rowcount > 0
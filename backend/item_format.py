@@ -0,0 +1,44 @@
+"""
+Plain-text item listings for the list_items tool.
+
+Shared by the HTTP endpoint in main.py and the stdio server in mcp_server.py
+so both render items the same way.
+"""
+
+import asyncio
+
+import database as db
+
+# Listings longer than this are rendered in a worker thread
+RENDER_IN_THREAD_THRESHOLD = 500
+
+
+def format_item_line(item: db.Item) -> str:
+    return (
+        f"  #{item.id}: [{item.category}] {item.family_member} - {item.title}"
+        f"{' at ' + item.time if item.time else ''}"
+        f"{' (' + item.recurrence + ')' if item.recurrence else ''}"
+        f"{' [STAY]' if item.stay_until_done else ''}"
+        f"{' [HANDLED]' if item.handled else ''}"
+    )
+
+
+def render_items(header: str, items: list[db.Item], show_date: bool = False) -> str:
+    if not items:
+        return f"{header}\n(none)"
+
+    if show_date:
+        body = "\n".join(f"{format_item_line(item)} (date: {item.date})" for item in items)
+    else:
+        body = "\n".join(map(format_item_line, items))
+    return f"{header}\n{body}"
+
+
+async def render_items_nonblocking(header: str, items: list[db.Item], show_date: bool = False) -> str:
+    """Render with render_items, in a worker thread for long listings.
+
+    Keeps the event loop free for other requests while a large dump is formatted.
+    """
+    if len(items) > RENDER_IN_THREAD_THRESHOLD:
+        return await asyncio.to_thread(render_items, header, items, show_date)
+    return render_items(header, items, show_date)
@@ -0,0 +1,35 @@
+"""
+Request models for creating and updating items.
+
+Shared by the REST API and MCP tools in main.py and the stdio server in
+mcp_server.py so both accept the same fields.
+"""
+
+from pydantic import BaseModel
+
+
+class ItemCreate(BaseModel):
+    title: str
+    family_member: str
+    date: str
+    time: str | None = None
+    category: str
+    recurrence: str | None = None
+    recurrence_day: int | None = None
+    stay_until_done: bool = False
+
+
+class ItemUpdate(BaseModel):
+    title: str | None = None
+    family_member: str | None = None
+    date: str | None = None
+    time: str | None = None
+    category: str | None = None
+    recurrence: str | None = None
+    recurrence_day: int | None = None
+    stay_until_done: bool | None = None
+
+
+class UpdateItemArgs(ItemUpdate):
+    """update_item tool arguments: the fields to change plus the item's ID."""
+    item_id: int
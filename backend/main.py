@@ -1,15 +1,24 @@
 import asyncio
-import json
+import secrets
+import time
 import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, date, timedelta
-from typing import Set, Any, Optional
+from typing import Set, Any, AsyncIterator, Awaitable, Callable, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response
+import orjson
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from pydantic import BaseModel
 
 import database as db
+from item_format import format_item_line, render_items_nonblocking
+from item_models import ItemCreate, ItemUpdate
+from tool_schemas import TOOL_SCHEMAS, TOOL_SCHEMAS_JSON, drop_nulls
 
 
 # MCP Protocol Constants
@@ -17,6 +26,12 @@ MCP_PROTOCOL_VERSION = "2025-03-26"
 MCP_SERVER_NAME = "big-board"
 MCP_SERVER_VERSION = "1.0.0"
 
+# Max WebSocket sends per event-loop turn during a broadcast
+BROADCAST_BATCH_SIZE = 50
+# How long a rendered list_items tool result may be reused
+LIST_ITEMS_CACHE_TTL = 5.0
+LIST_ITEMS_CACHE_SIZE = 32
+
 
 class ConnectionManager:
     """Manages WebSocket connections and broadcasts updates."""
@@ -33,51 +48,148 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients."""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.add(connection)
+        # Serialize once and reuse the text frame for every client. Text (not
+        # bytes) keeps the frames parseable with JSON.parse(event.data).
+        payload = orjson.dumps(message).decode()
+        # Send each batch concurrently so one slow client doesn't hold up the
+        # rest, yielding to the event loop between batches so a large fan-out
+        # doesn't starve other requests
+        connections = list(self.active_connections)
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True,
+            )
 
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+            # Clean up disconnected clients
+            for conn, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self.active_connections.discard(conn)
 
 
 manager = ConnectionManager()
 
 
+# (epoch minute, display date, is tomorrow); the answer can only change on a minute boundary
+_display_date_cache: Optional[tuple[int, date, bool]] = None
+
+
+def get_display_info() -> tuple[date, bool]:
+    """Get the date to display and whether it is tomorrow (today before 7PM, tomorrow after)."""
+    global _display_date_cache
+    minute = int(time.time()) // 60
+    if _display_date_cache is not None and _display_date_cache[0] == minute:
+        return _display_date_cache[1], _display_date_cache[2]
+
+    now = datetime.now()
+    is_tomorrow = now.hour >= 19  # 7 PM or later
+    if is_tomorrow:
+        display_date = (now + timedelta(days=1)).date()
+    else:
+        display_date = now.date()
+    _display_date_cache = (minute, display_date, is_tomorrow)
+    return display_date, is_tomorrow
+
+
 def get_display_date() -> date:
     """Get the date to display based on current time (today before 7PM, tomorrow after)."""
-    now = datetime.now()
-    if now.hour >= 19:  # 7 PM or later
-        return (now + timedelta(days=1)).date()
-    return now.date()
+    return get_display_info()[0]
+
+
+# Broadcast payload pieces that only change on rare admin actions.
+# None means "reload from the database on next use".
+_cache: dict[str, Any] = {"family_members": None, "categories": None}
+_cache_lock = asyncio.Lock()
+
+
+async def get_cached_lookups() -> tuple[dict[str, str], list[str]]:
+    """Get the family member color map and category names, loading on a miss."""
+    async with _cache_lock:
+        if _cache["family_members"] is None:
+            family_members = await db.get_family_members()
+            _cache["family_members"] = {fm.name: fm.color for fm in family_members}
+        if _cache["categories"] is None:
+            categories = await db.get_categories()
+            _cache["categories"] = [c.name for c in categories]
+        return _cache["family_members"], _cache["categories"]
+
+
+async def invalidate_cache(*keys: str):
+    """Drop cached lookups after a mutation.
+
+    Takes the lock so a load already in flight can't store stale data afterwards.
+    """
+    async with _cache_lock:
+        for key in keys:
+            _cache[key] = None
 
 
 async def broadcast_items():
     """Broadcast current items to all clients."""
-    display_date = get_display_date()
-    items = await db.get_items_for_date(display_date)
-    family_members = await db.get_family_members()
-    categories = await db.get_categories()
+    display_date, is_tomorrow = get_display_info()
+    items = await db.get_items_for_date_raw(display_date)
+    family_members, categories = await get_cached_lookups()
 
     await manager.broadcast({
         "type": "update",
         "display_date": display_date.isoformat(),
-        "is_tomorrow": display_date != date.today(),
-        "items": [item.model_dump() for item in items],
-        "family_members": {fm.name: fm.color for fm in family_members},
-        "categories": [c.name for c in categories],
+        "is_tomorrow": is_tomorrow,
+        "items": items,
+        "family_members": family_members,
+        "categories": categories,
     })
 
 
+async def broadcast_delta(op: str, payload: dict, **extra: Any):
+    """Broadcast a single change instead of the full list.
+
+    Ops: "add" / "update" carry the item as shown on the display date,
+    "remove" carries {"id": ...} and "category_add" carries {"name": ...}.
+    """
+    await manager.broadcast({"type": "delta", "op": op, "item": payload, **extra})
+
+
+async def broadcast_item_delta(item_id: int, op: str = "update", **extra: Any):
+    """Broadcast an added or changed item as a delta.
+
+    Sends a "remove" when the item is no longer shown on the display date
+    (moved to another day, or a handled stay_until_done item). Nothing is
+    sent for a new item that isn't shown at all.
+    """
+    item = await db.get_item_for_date_raw(item_id, get_display_date())
+    if item:
+        await broadcast_delta(op, item, **extra)
+    elif op != "add":
+        await broadcast_delta("remove", {"id": item_id})
+
+
+# Strong references so background broadcasts aren't garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
+# Background broadcasts run one at a time, in the order they were scheduled
+# (asyncio.Lock is FIFO), so clients still see deltas in mutation order
+_background_broadcast_lock = asyncio.Lock()
+
+
+def broadcast_in_background(coro: Awaitable[None]):
+    """Run a broadcast without making the caller wait for the fan-out."""
+    async def run():
+        async with _background_broadcast_lock:
+            await coro
+
+    task = asyncio.create_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database on startup and close it on shutdown."""
     await db.init_db()
     yield
+    await db.close_db()
 
 
 app = FastAPI(title="Big Board", lifespan=lifespan)
@@ -97,18 +209,17 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         # Send initial data
-        display_date = get_display_date()
-        items = await db.get_items_for_date(display_date)
-        family_members = await db.get_family_members()
-        categories = await db.get_categories()
+        display_date, is_tomorrow = get_display_info()
+        items = await db.get_items_for_date_raw(display_date)
+        family_members, categories = await get_cached_lookups()
 
         await websocket.send_json({
             "type": "init",
             "display_date": display_date.isoformat(),
-            "is_tomorrow": display_date != date.today(),
-            "items": [item.model_dump() for item in items],
-            "family_members": {fm.name: fm.color for fm in family_members},
-            "categories": [c.name for c in categories],
+            "is_tomorrow": is_tomorrow,
+            "items": items,
+            "family_members": family_members,
+            "categories": categories,
         })
 
         # Listen for messages from client
@@ -126,8 +237,9 @@ async def handle_client_message(data: dict):
     if msg_type == "mark_handled":
         item_id = data.get("item_id")
         handled = data.get("handled", True)
-        await db.mark_item_handled(item_id, handled)
-        await broadcast_items()
+        item = await db.mark_item_handled(item_id, handled)
+        if item:
+            await broadcast_item_delta(item_id)
 
     elif msg_type == "refresh":
         await broadcast_items()
@@ -135,51 +247,54 @@ async def handle_client_message(data: dict):
 
 # REST API endpoints (for MCP server to call)
 
-class ItemCreate(BaseModel):
-    title: str
-    family_member: str
-    date: str
-    time: str | None = None
-    category: str
-    recurrence: str | None = None
-    recurrence_day: int | None = None
-    stay_until_done: bool = False
-
-
-class ItemUpdate(BaseModel):
-    title: str | None = None
-    family_member: str | None = None
-    date: str | None = None
-    time: str | None = None
-    category: str | None = None
-    recurrence: str | None = None
-    recurrence_day: int | None = None
-    stay_until_done: bool | None = None
-
-
 @app.post("/api/items")
 async def create_item(item: ItemCreate):
     new_item = await db.add_item(db.Item(**item.model_dump()))
+    await invalidate_cache("family_members")
     await broadcast_items()
     return {"status": "ok", "item": new_item.model_dump()}
 
 
+@app.post("/api/items/bulk")
+async def create_items(items: list[ItemCreate]):
+    new_items = await db.add_items([db.Item(**item.model_dump()) for item in items])
+    await invalidate_cache("family_members")
+    await broadcast_items()
+    return {"status": "ok", "items": [item.model_dump() for item in new_items]}
+
+
+# format=text returns the same rendering as the MCP tools, for mcp_remote to pass through
+TextFormat = Query("json", alias="format", pattern="^(json|text)$")
+
+
 @app.get("/api/items")
-async def list_items(date_from: str | None = None, date_to: str | None = None):
-    if date_from:
-        target = datetime.strptime(date_from, "%Y-%m-%d").date()
-        items = await db.get_items_for_date(target)
+async def list_items(date_from: str | None = None, date_to: str | None = None, fmt: str = TextFormat):
+    if date_to is None or date_to == date_from:
+        # A single day includes recurring and stay-until-done items
+        if fmt == "text":
+            return PlainTextResponse(await _tool_list_items({"date": date_from}))
+        if date_from:
+            target = date.fromisoformat(date_from)
+            items = await db.get_items_for_date(target)
+        else:
+            items = await db.get_all_items()
     else:
-        items = await db.get_all_items()
+        items = await db.get_items_in_range(
+            date.fromisoformat(date_from) if date_from else None,
+            date.fromisoformat(date_to),
+        )
+        if fmt == "text":
+            return PlainTextResponse(await render_items_nonblocking(
+                f"Items from {date_from or 'the start'} to {date_to}:", items, show_date=True
+            ))
     return {"items": [item.model_dump() for item in items]}
 
 
 @app.get("/api/items/{item_id}")
 async def get_item(item_id: int):
-    items = await db.get_all_items()
-    for item in items:
-        if item.id == item_id:
-            return {"item": item.model_dump()}
+    item = await db.get_item_by_id(item_id)
+    if item:
+        return {"item": item.model_dump()}
     return {"error": "Item not found"}, 404
 
 
@@ -188,7 +303,7 @@ async def update_item(item_id: int, updates: ItemUpdate):
     update_dict = {k: v for k, v in updates.model_dump().items() if v is not None}
     item = await db.update_item(item_id, update_dict)
     if item:
-        await broadcast_items()
+        await broadcast_item_delta(item_id)
         return {"status": "ok", "item": item.model_dump()}
     return {"error": "Item not found"}, 404
 
@@ -197,7 +312,7 @@ async def update_item(item_id: int, updates: ItemUpdate):
 async def delete_item(item_id: int):
     success = await db.delete_item(item_id)
     if success:
-        await broadcast_items()
+        await broadcast_delta("remove", {"id": item_id})
         return {"status": "ok"}
     return {"error": "Item not found"}, 404
 
@@ -206,33 +321,43 @@ async def delete_item(item_id: int):
 async def mark_handled(item_id: int, handled: bool = True):
     item = await db.mark_item_handled(item_id, handled)
     if item:
-        await broadcast_items()
+        await broadcast_item_delta(item_id)
         return {"status": "ok", "item": item.model_dump()}
     return {"error": "Item not found"}, 404
 
 
 @app.get("/api/family-members")
-async def list_family_members():
+async def list_family_members(fmt: str = TextFormat):
+    if fmt == "text":
+        return PlainTextResponse(await _tool_list_family_members({}))
     members = await db.get_family_members()
     return {"family_members": [m.model_dump() for m in members]}
 
 
 @app.put("/api/family-members/{name}/color")
-async def update_member_color(name: str, color: str):
+async def update_member_color(name: str, color: str = Query(pattern=r"^#?[0-9A-Fa-f]{6}$")):
     member = await db.update_family_member_color(name, color)
+    await invalidate_cache("family_members")
     await broadcast_items()
     return {"status": "ok", "family_member": member.model_dump()}
 
 
 @app.get("/api/categories")
-async def list_categories():
+async def list_categories(fmt: str = TextFormat):
+    if fmt == "text":
+        return PlainTextResponse(await _tool_list_categories({}))
     categories = await db.get_categories()
     return {"categories": [c.name for c in categories]}
 
 
+class CategoryCreate(BaseModel):
+    name: str
+
+
 @app.post("/api/categories")
-async def create_category(name: str):
-    category = await db.add_category(name)
+async def create_category(body: CategoryCreate):
+    category = await db.add_category(body.name)
+    await invalidate_cache("categories")
     await broadcast_items()
     return {"status": "ok", "category": category.model_dump()}
 
@@ -241,6 +366,7 @@ async def create_category(name: str):
 async def remove_category(name: str):
     success = await db.delete_category(name)
     if success:
+        await invalidate_cache("categories")
         await broadcast_items()
         return {"status": "ok"}
     return {"error": "Category not found"}, 404
@@ -250,179 +376,201 @@ async def remove_category(name: str):
 # MCP (Model Context Protocol) HTTP Endpoint
 # ============================================================================
 
-MCP_TOOLS = [
-    {
-        "name": "add_item",
-        "description": """Add a new item to the family dashboard.
-
-Use this to add meetings, reminders, school events, tasks, or activities.
-Items will appear on the dashboard for the specified date.
-
-Recurrence options:
-- null: one-time item
-- "daily": every day
-- "weekdays": Monday through Friday
-- "weekly": same day each week
-- "monthly": same date each month
-
-Stay Until Done:
-Set stay_until_done=true for items that should remain on the dashboard until
-marked as done, regardless of date. After 24 hours these items will blink as alerts.""",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "title": {"type": "string", "description": "Brief description of the item"},
-                "family_member": {"type": "string", "description": "Who this is for (e.g., 'Dad', 'Emma', 'Everyone')"},
-                "date": {"type": "string", "description": "Date in YYYY-MM-DD format"},
-                "time": {"type": "string", "description": "Optional time in HH:MM format (24-hour)"},
-                "category": {"type": "string", "description": "Category: Meeting, School, Reminder, Task, or Activity"},
-                "recurrence": {"type": "string", "enum": ["daily", "weekdays", "weekly", "monthly"], "description": "Optional recurrence pattern"},
-                "stay_until_done": {"type": "boolean", "description": "If true, item stays on dashboard until marked done. Blinks after 24 hours."}
-            },
-            "required": ["title", "family_member", "date", "category"]
-        }
-    },
-    {
-        "name": "list_items",
-        "description": "List items on the family dashboard for a specific date or all items.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "date": {"type": "string", "description": "Optional date in YYYY-MM-DD format"}
-            }
-        }
-    },
-    {
-        "name": "remove_item",
-        "description": "Remove an item from the dashboard by its ID.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "item_id": {"type": "integer", "description": "The ID of the item to remove"}
-            },
-            "required": ["item_id"]
-        }
-    },
-    {
-        "name": "update_item",
-        "description": "Update an existing item on the dashboard.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "item_id": {"type": "integer", "description": "The ID of the item to update"},
-                "title": {"type": "string"},
-                "family_member": {"type": "string"},
-                "date": {"type": "string"},
-                "time": {"type": "string"},
-                "category": {"type": "string"},
-                "recurrence": {"type": "string"},
-                "stay_until_done": {"type": "boolean", "description": "If true, item stays until marked done."}
-            },
-            "required": ["item_id"]
-        }
-    },
-    {
-        "name": "list_family_members",
-        "description": "List all family members and their assigned colors.",
-        "inputSchema": {"type": "object", "properties": {}}
-    },
-    {
-        "name": "list_categories",
-        "description": "List all available categories.",
-        "inputSchema": {"type": "object", "properties": {}}
-    },
-    {
-        "name": "add_category",
-        "description": "Add a new category to the dashboard.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string", "description": "Name of the new category"}
-            },
-            "required": ["name"]
-        }
-    }
-]
+MCP_TOOLS = TOOL_SCHEMAS
 
 
-async def handle_mcp_tool_call(name: str, arguments: dict) -> str:
-    """Execute an MCP tool and return the result as text."""
-    if name == "add_item":
-        item = db.Item(
-            title=arguments["title"],
-            family_member=arguments["family_member"],
-            date=arguments["date"],
-            time=arguments.get("time"),
-            category=arguments["category"],
-            recurrence=arguments.get("recurrence"),
-            stay_until_done=arguments.get("stay_until_done", False),
+def _item_from_arguments(arguments: dict) -> db.Item:
+    return db.Item(**ItemCreate.model_validate(arguments).model_dump())
+
+
+async def _tool_add_item(arguments: dict) -> str:
+    created = await db.add_item(_item_from_arguments(arguments))
+    await invalidate_cache("family_members")
+    broadcast_in_background(_broadcast_added_item(created))
+    stay_str = " [STAY UNTIL DONE]" if created.stay_until_done else ""
+    return f"Added item #{created.id}: '{created.title}' for {created.family_member} on {created.date}{stay_str}"
+
+
+async def _broadcast_added_item(item: db.Item):
+    # Include the member's color, which is new if this is their first item
+    family_members, _ = await get_cached_lookups()
+    await broadcast_item_delta(
+        item.id, "add",
+        family_members={item.family_member: family_members.get(item.family_member)},
+    )
+
+
+async def _tool_add_items(arguments: dict) -> str:
+    created = await db.add_items([_item_from_arguments(a) for a in arguments["items"]])
+    await invalidate_cache("family_members")
+    # One full update instead of a delta per item
+    broadcast_in_background(broadcast_items())
+    return f"Added {len(created)} items: " + ", ".join(f"#{item.id}" for item in created)
+
+
+# Rendered list_items text keyed by the date argument ("" for all items):
+# (db.items_version() when rendered, expiry, text). Any item write in this
+# process changes the version; the TTL bounds staleness from other processes.
+_list_items_cache: dict[str, tuple[int, float, str]] = {}
+
+
+def _get_cached_list_items(date_str: str) -> Optional[str]:
+    cached = _list_items_cache.get(date_str)
+    if cached and cached[0] == db.items_version() and cached[1] > time.monotonic():
+        return cached[2]
+    return None
+
+
+def _cache_list_items(date_str: str, version: int, text: str):
+    if date_str not in _list_items_cache and len(_list_items_cache) >= LIST_ITEMS_CACHE_SIZE:
+        # Evict the oldest entry
+        del _list_items_cache[next(iter(_list_items_cache))]
+    _list_items_cache[date_str] = (version, time.monotonic() + LIST_ITEMS_CACHE_TTL, text)
+
+
+async def _tool_list_items(arguments: dict) -> str:
+    date_str = arguments.get("date") or ""
+    cached = _get_cached_list_items(date_str)
+    if cached is not None:
+        return cached
+
+    # Read the version before querying so a write during the query isn't cached over
+    version = db.items_version()
+    text = await _render_list_items(date_str)
+    _cache_list_items(date_str, version, text)
+    return text
+
+
+async def _render_list_items(date_str: str) -> str:
+    if date_str:
+        target = date.fromisoformat(date_str)
+        items = await db.get_items_for_date(target)
+        header = f"Items for {date_str}:"
+    else:
+        items = await db.get_all_items()
+        header = "All items:"
+    return await render_items_nonblocking(header, items)
+
+
+def _json_str_fragment(text: str) -> bytes:
+    """JSON-escape text for splicing into an already-open JSON string."""
+    return orjson.dumps(text)[1:-1]
+
+
+async def _stream_all_items(req_id: Any) -> AsyncIterator[bytes]:
+    """Stream the undated list_items result as one SSE message event.
+
+    Produces the same JSON-RPC response as the one-shot path, but each item
+    line is written as soon as it is read, so the client gets the first bytes
+    of a full dump immediately. The written fragments are kept so a completed
+    stream can fill the list_items cache.
+    """
+    version = db.items_version()
+    items = db.iter_all_items()
+    try:
+        try:
+            item = await anext(items, None)
+        except Exception as e:
+            # Nothing sent yet, so answer with a plain JSON-RPC error
+            yield b"event: message\ndata: " + orjson.dumps(jsonrpc_error(req_id, -32603, str(e))) + b"\n\n"
+            return
+
+        yield (
+            b'event: message\ndata: {"jsonrpc":"2.0","id":' + orjson.dumps(req_id)
+            + b',"result":{"content":[{"type":"text","text":"' + _json_str_fragment("All items:")
         )
-        created = await db.add_item(item)
-        await broadcast_items()
-        stay_str = " [STAY UNTIL DONE]" if created.stay_until_done else ""
-        return f"Added item #{created.id}: '{created.title}' for {created.family_member} on {created.date}{stay_str}"
+        fragments: list[bytes] = []
+        try:
+            if item is None:
+                fragments.append(_json_str_fragment("\n(none)"))
+                yield fragments[-1]
+            while item is not None:
+                fragments.append(_json_str_fragment("\n" + format_item_line(item)))
+                yield fragments[-1]
+                item = await anext(items, None)
+        except Exception as e:
+            # The result is already open; close it as a tool error so the
+            # frame still parses
+            yield _json_str_fragment(f"\nError: {e}") + b'"}],"isError":true}}\n\n'
+            return
+        yield b'"}]}}\n\n'
+    finally:
+        await items.aclose()
+
+    text = "All items:" + orjson.loads(b'"' + b"".join(fragments) + b'"')
+    _cache_list_items("", version, text)
+
+
+async def _tool_remove_item(arguments: dict) -> str:
+    item_id = arguments["item_id"]
+    success = await db.delete_item(item_id)
+    if success:
+        broadcast_in_background(broadcast_delta("remove", {"id": item_id}))
+        return f"Removed item #{item_id}"
+    return f"Item #{item_id} not found"
 
-    elif name == "list_items":
-        date_str = arguments.get("date")
-        if date_str:
-            target = datetime.strptime(date_str, "%Y-%m-%d").date()
-            items = await db.get_items_for_date(target)
-            header = f"Items for {date_str}:"
-        else:
-            items = await db.get_all_items()
-            header = "All items:"
-
-        if not items:
-            return f"{header}\n(none)"
-
-        lines = [header]
-        for item in items:
-            time_str = f" at {item.time}" if item.time else ""
-            recur_str = f" ({item.recurrence})" if item.recurrence else ""
-            handled_str = " [HANDLED]" if item.handled else ""
-            stay_str = " [STAY]" if item.stay_until_done else ""
-            lines.append(
-                f"  #{item.id}: [{item.category}] {item.family_member} - {item.title}"
-                f"{time_str}{recur_str}{stay_str}{handled_str}"
-            )
-        return "\n".join(lines)
-
-    elif name == "remove_item":
-        item_id = arguments["item_id"]
-        success = await db.delete_item(item_id)
-        if success:
-            await broadcast_items()
-            return f"Removed item #{item_id}"
-        return f"Item #{item_id} not found"
-
-    elif name == "update_item":
-        item_id = arguments["item_id"]
-        updates = {k: v for k, v in arguments.items() if k != "item_id" and v is not None}
-        item = await db.update_item(item_id, updates)
-        if item:
-            await broadcast_items()
-            return f"Updated item #{item_id}: {item.title}"
-        return f"Item #{item_id} not found"
-
-    elif name == "list_family_members":
-        members = await db.get_family_members()
-        if not members:
-            return "No family members yet (they are created when items are added)"
-        lines = ["Family members:"]
-        for m in members:
-            lines.append(f"  {m.name}: {m.color}")
-        return "\n".join(lines)
-
-    elif name == "list_categories":
-        categories = await db.get_categories()
-        return "Categories: " + ", ".join(c.name for c in categories)
-
-    elif name == "add_category":
-        category = await db.add_category(arguments["name"])
-        await broadcast_items()
-        return f"Added category: {category.name}"
 
-    return f"Unknown tool: {name}"
+async def _tool_update_item(arguments: dict) -> str:
+    item_id = arguments["item_id"]
+    updates = ItemUpdate.model_validate(arguments).model_dump(exclude_none=True)
+    item = await db.update_item(item_id, updates)
+    if item:
+        broadcast_in_background(broadcast_item_delta(item_id))
+        return f"Updated item #{item_id}: {item.title}"
+    return f"Item #{item_id} not found"
+
+
+async def _tool_list_family_members(arguments: dict) -> str:
+    members = await db.get_family_members()
+    if not members:
+        return "No family members yet (they are created when items are added)"
+    lines = ["Family members:"]
+    for m in members:
+        lines.append(f"  {m.name}: {m.color}")
+    return "\n".join(lines)
+
+
+async def _tool_list_categories(arguments: dict) -> str:
+    categories = await db.get_categories()
+    return "Categories: " + ", ".join(c.name for c in categories)
+
+
+async def _tool_add_category(arguments: dict) -> str:
+    category = await db.add_category(arguments["name"])
+    await invalidate_cache("categories")
+    broadcast_in_background(broadcast_delta("category_add", {"name": category.name}))
+    return f"Added category: {category.name}"
+
+
+async def _tool_dashboard_snapshot(arguments: dict) -> str:
+    # Independent reads, so issue them together rather than one after another
+    parts = await asyncio.gather(
+        _tool_list_items({"date": arguments["date"]}),
+        _tool_list_family_members({}),
+        _tool_list_categories({}),
+    )
+    return "\n\n".join(parts)
+
+
+TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[str]]] = {
+    "add_item": _tool_add_item,
+    "add_items": _tool_add_items,
+    "list_items": _tool_list_items,
+    "remove_item": _tool_remove_item,
+    "update_item": _tool_update_item,
+    "list_family_members": _tool_list_family_members,
+    "list_categories": _tool_list_categories,
+    "add_category": _tool_add_category,
+    "dashboard_snapshot": _tool_dashboard_snapshot,
+}
+
+
+async def handle_mcp_tool_call(name: str, arguments: dict) -> str:
+    """Execute an MCP tool and return the result as text."""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}"
+    return await handler(arguments)
 
 
 def jsonrpc_response(id: Any, result: Any) -> dict:
@@ -435,85 +583,127 @@ def jsonrpc_error(id: Any, code: int, message: str) -> dict:
     return {"jsonrpc": "2.0", "id": id, "error": {"code": code, "message": message}}
 
 
-@app.post("/mcp")
-async def mcp_endpoint(request: Request):
-    """MCP Streamable HTTP endpoint."""
-    try:
-        body = await request.json()
-    except Exception:
-        return Response(
-            content=json.dumps(jsonrpc_error(None, -32700, "Parse error")),
-            media_type="application/json",
-            status_code=400
+def jsonrpc_response_raw(id: Any, result_json: bytes) -> bytes:
+    """Create a JSON-RPC 2.0 response around an already-serialized result."""
+    return b'{"jsonrpc":"2.0","id":' + orjson.dumps(id) + b',"result":' + result_json + b'}'
+
+
+# Static results, serialized once at import; only the request id varies
+MCP_INITIALIZE_RESULT_JSON = orjson.dumps({
+    "protocolVersion": MCP_PROTOCOL_VERSION,
+    "serverInfo": {
+        "name": MCP_SERVER_NAME,
+        "version": MCP_SERVER_VERSION
+    },
+    "capabilities": {
+        "tools": {}
+    }
+})
+MCP_TOOLS_LIST_RESULT_JSON = b'{"tools":' + TOOL_SCHEMAS_JSON + b"}"
+
+
+SESSION_ID_BATCH_SIZE = 256
+_session_ids: deque[str] = deque()
+
+
+def new_session_id() -> str:
+    """Return a random (version 4) UUID string for a new MCP session.
+
+    Session IDs must stay unguessable, so they come from the OS CSPRNG, but
+    in batches: one urandom read covers SESSION_ID_BATCH_SIZE sessions.
+    """
+    if not _session_ids:
+        raw = secrets.token_bytes(16 * SESSION_ID_BATCH_SIZE)
+        _session_ids.extend(
+            str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)
         )
+    return _session_ids.popleft()
 
-    method = body.get("method")
-    params = body.get("params", {})
-    req_id = body.get("id")
 
-    # Handle different MCP methods
-    if method == "initialize":
+# One validator per tool, built once from its inputSchema
+TOOL_VALIDATORS = {tool["name"]: Draft202012Validator(tool["inputSchema"]) for tool in TOOL_SCHEMAS}
+
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    return Response(content=content, media_type="application/json", status_code=status_code)
+
+
+async def _mcp_initialize(req_id: Any, params: dict, request: Request) -> Response:
+    resp = _json_response(jsonrpc_response_raw(req_id, MCP_INITIALIZE_RESULT_JSON))
+    resp.headers["Mcp-Session-Id"] = new_session_id()
+    return resp
+
+
+async def _mcp_initialized(req_id: Any, params: dict, request: Request) -> Response:
+    # Client acknowledgment - no response needed
+    return Response(status_code=202)
+
+
+async def _mcp_tools_list(req_id: Any, params: dict, request: Request) -> Response:
+    return _json_response(jsonrpc_response_raw(req_id, MCP_TOOLS_LIST_RESULT_JSON))
+
+
+async def _mcp_tools_call(req_id: Any, params: dict, request: Request) -> Response:
+    tool_name = params.get("name")
+    arguments = drop_nulls(params.get("arguments") or {})
+
+    # Reject bad arguments here rather than failing somewhere in the DB layer
+    validator = TOOL_VALIDATORS.get(tool_name)
+    if validator is not None:
+        error = best_match(validator.iter_errors(arguments))
+        if error is not None:
+            return _json_response(
+                orjson.dumps(jsonrpc_error(req_id, -32602, f"Invalid params: {error.message}")),
+                status_code=400
+            )
+
+    try:
+        # An uncached full dump is streamed to clients that accept SSE;
+        # dated listings and cache hits go through the one-shot path
+        if (tool_name == "list_items" and not arguments.get("date")
+                and "text/event-stream" in request.headers.get("accept", "")
+                and _get_cached_list_items("") is None):
+            return StreamingResponse(_stream_all_items(req_id), media_type="text/event-stream")
+        text_result = await handle_mcp_tool_call(tool_name, arguments)
         result = {
-            "protocolVersion": MCP_PROTOCOL_VERSION,
-            "serverInfo": {
-                "name": MCP_SERVER_NAME,
-                "version": MCP_SERVER_VERSION
-            },
-            "capabilities": {
-                "tools": {}
-            }
+            "content": [{"type": "text", "text": text_result}]
         }
-        response = jsonrpc_response(req_id, result)
-        resp = Response(
-            content=json.dumps(response),
-            media_type="application/json"
-        )
-        resp.headers["Mcp-Session-Id"] = str(uuid.uuid4())
-        return resp
-
-    elif method == "notifications/initialized":
-        # Client acknowledgment - no response needed
-        return Response(status_code=202)
-
-    elif method == "tools/list":
-        result = {"tools": MCP_TOOLS}
-        return Response(
-            content=json.dumps(jsonrpc_response(req_id, result)),
-            media_type="application/json"
-        )
+        return _json_response(orjson.dumps(jsonrpc_response(req_id, result)))
+    except Exception as e:
+        return _json_response(orjson.dumps(jsonrpc_error(req_id, -32603, str(e))), status_code=500)
 
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
 
-        try:
-            text_result = await handle_mcp_tool_call(tool_name, arguments)
-            result = {
-                "content": [{"type": "text", "text": text_result}]
-            }
-            return Response(
-                content=json.dumps(jsonrpc_response(req_id, result)),
-                media_type="application/json"
-            )
-        except Exception as e:
-            return Response(
-                content=json.dumps(jsonrpc_error(req_id, -32603, str(e))),
-                media_type="application/json",
-                status_code=500
-            )
+async def _mcp_ping(req_id: Any, params: dict, request: Request) -> Response:
+    return _json_response(orjson.dumps(jsonrpc_response(req_id, {})))
 
-    elif method == "ping":
-        return Response(
-            content=json.dumps(jsonrpc_response(req_id, {})),
-            media_type="application/json"
-        )
 
-    else:
-        return Response(
-            content=json.dumps(jsonrpc_error(req_id, -32601, f"Method not found: {method}")),
-            media_type="application/json",
+MCP_METHOD_HANDLERS: dict[str, Callable[[Any, dict, Request], Awaitable[Response]]] = {
+    "initialize": _mcp_initialize,
+    "notifications/initialized": _mcp_initialized,
+    "tools/list": _mcp_tools_list,
+    "tools/call": _mcp_tools_call,
+    "ping": _mcp_ping,
+}
+
+
+@app.post("/mcp")
+async def mcp_endpoint(request: Request):
+    """MCP Streamable HTTP endpoint."""
+    try:
+        body = orjson.loads(await request.body())
+    except Exception:
+        return _json_response(orjson.dumps(jsonrpc_error(None, -32700, "Parse error")), status_code=400)
+
+    method = body.get("method")
+    req_id = body.get("id")
+
+    handler = MCP_METHOD_HANDLERS.get(method)
+    if handler is None:
+        return _json_response(
+            orjson.dumps(jsonrpc_error(req_id, -32601, f"Method not found: {method}")),
             status_code=404
         )
+    return await handler(req_id, body.get("params", {}), request)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""
+MCP tool definitions for Big Board.
+
+Shared by the HTTP endpoint in main.py, the stdio server in mcp_server.py
+and the remote proxy in mcp_remote.py so all three advertise the same tools.
+"""
+
+from typing import Any
+
+import orjson
+
+# Input for a single new item; shared by add_item and add_items
+_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "description": "Brief description of the item (e.g., 'Math homework due', 'Team standup')"},
+        "family_member": {"type": "string", "description": "Who this is for (e.g., 'Dad', 'Emma', 'Everyone')"},
+        "date": {"type": "string", "description": "Date in YYYY-MM-DD format"},
+        "time": {"type": "string", "description": "Optional time in HH:MM format (24-hour)"},
+        "category": {"type": "string", "description": "Category: Meeting, School, Reminder, Task, or Activity"},
+        "recurrence": {"type": "string", "enum": ["daily", "weekdays", "weekly", "monthly"], "description": "Optional recurrence pattern"},
+        "recurrence_day": {"type": "integer", "description": "For weekly: day of week (0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun). For monthly: day of month (1-31)."},
+        "stay_until_done": {"type": "boolean", "description": "If true, item stays on dashboard until marked done (ignores date). Blinks after 24 hours."}
+    },
+    "required": ["title", "family_member", "date", "category"]
+}
+
+TOOL_SCHEMAS: list[dict] = [
+    {
+        "name": "add_item",
+        "description": """Add a new item to the family dashboard.
+
+Use this to add meetings, reminders, school events, tasks, or activities.
+Items will appear on the dashboard for the specified date.
+
+Recurrence options:
+- null: one-time item
+- "daily": every day
+- "weekdays": Monday through Friday
+- "weekly": same day each week (use recurrence_day to specify which day)
+- "monthly": same date each month (use recurrence_day to specify which day)
+
+For weekly recurrence on a specific day, set recurrence="weekly" and recurrence_day to:
+0=Monday, 1=Tuesday, 2=Wednesday, 3=Thursday, 4=Friday, 5=Saturday, 6=Sunday
+
+Example: "Every Monday" = recurrence="weekly", recurrence_day=0
+
+Stay Until Done:
+Set stay_until_done=true for items that should remain on the dashboard until
+marked as done, regardless of date. After 24 hours these items will blink as alerts.""",
+        "inputSchema": _ITEM_SCHEMA
+    },
+    {
+        "name": "add_items",
+        "description": """Add several items to the family dashboard in one call.
+
+Each entry takes the same fields as add_item. Prefer this over repeated
+add_item calls when adding many items at once, e.g. a week of activities.""",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "items": {"type": "array", "items": _ITEM_SCHEMA, "minItems": 1, "description": "Items to add"}
+            },
+            "required": ["items"]
+        }
+    },
+    {
+        "name": "list_items",
+        "description": "List items on the family dashboard for a specific date or all items.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "date": {"type": "string", "description": "Optional date in YYYY-MM-DD format. If not provided, lists all items."}
+            }
+        }
+    },
+    {
+        "name": "remove_item",
+        "description": "Remove an item from the dashboard by its ID.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "item_id": {"type": "integer", "description": "The ID of the item to remove"}
+            },
+            "required": ["item_id"]
+        }
+    },
+    {
+        "name": "update_item",
+        "description": "Update an existing item on the dashboard.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "item_id": {"type": "integer", "description": "The ID of the item to update"},
+                "title": {"type": "string"},
+                "family_member": {"type": "string"},
+                "date": {"type": "string"},
+                "time": {"type": "string"},
+                "category": {"type": "string"},
+                "recurrence": {"type": "string"},
+                "recurrence_day": {"type": "integer", "description": "For weekly: 0-6 (Mon-Sun). For monthly: 1-31."},
+                "stay_until_done": {"type": "boolean", "description": "If true, item stays until marked done."}
+            },
+            "required": ["item_id"]
+        }
+    },
+    {
+        "name": "list_family_members",
+        "description": "List all family members and their assigned colors.",
+        "inputSchema": {"type": "object", "properties": {}}
+    },
+    {
+        "name": "list_categories",
+        "description": "List all available categories.",
+        "inputSchema": {"type": "object", "properties": {}}
+    },
+    {
+        "name": "add_category",
+        "description": "Add a new category to the dashboard.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the new category"}
+            },
+            "required": ["name"]
+        }
+    },
+    {
+        "name": "dashboard_snapshot",
+        "description": "Get the items for a date together with all family members and categories, in one call.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "date": {"type": "string", "description": "Date in YYYY-MM-DD format"}
+            },
+            "required": ["date"]
+        }
+    }
+]
+
+# Serialized once at import for the HTTP tools/list response
+TOOL_SCHEMAS_JSON: bytes = orjson.dumps(TOOL_SCHEMAS)
+
+
+def drop_nulls(value: Any) -> Any:
+    """Remove null fields from tool arguments, recursively.
+
+    Agents send null for unset optional fields (e.g. recurrence); the schemas
+    and argument models treat those as absent.
+    """
+    if isinstance(value, dict):
+        return {k: drop_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [drop_nulls(v) for v in value]
+    return value
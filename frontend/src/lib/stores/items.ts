@@ -112,6 +112,15 @@ export function connectWebSocket() {
 	};
 }
 
+// Same order as the backend: by time (untimed last), then title
+function compareItems(a: Item, b: Item): number {
+	const timeA = a.time ?? '99:99';
+	const timeB = b.time ?? '99:99';
+	if (timeA !== timeB) return timeA < timeB ? -1 : 1;
+	if (a.title !== b.title) return a.title < b.title ? -1 : 1;
+	return 0;
+}
+
 function handleMessage(data: any) {
 	if (data.type === 'init' || data.type === 'update') {
 		dashboardState.update(state => ({
@@ -122,6 +131,28 @@ function handleMessage(data: any) {
 			displayDate: data.display_date,
 			isTomorrow: data.is_tomorrow
 		}));
+	} else if (data.type === 'delta') {
+		dashboardState.update(state => applyDelta(state, data));
+	}
+}
+
+// Apply a single-change message on top of the last full list
+function applyDelta(state: DashboardState, data: any): DashboardState {
+	switch (data.op) {
+		case 'add':
+		case 'update':
+			return {
+				...state,
+				familyMembers: { ...state.familyMembers, ...data.family_members },
+				items: [...state.items.filter(item => item.id !== data.item.id), data.item].sort(compareItems)
+			};
+		case 'remove':
+			return { ...state, items: state.items.filter(item => item.id !== data.item.id) };
+		case 'category_add':
+			if (state.categories.includes(data.item.name)) return state;
+			return { ...state, categories: [...state.categories, data.item.name].sort() };
+		default:
+			return state;
 	}
 }
 